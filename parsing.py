@@ -6,35 +6,149 @@ with Nutrient OCR fallback for complex documents.
 """
 
 import os
+import re
 import logging
+import zipfile
 from typing import Optional
+from xml.etree import ElementTree
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Quality-heuristic patterns, compiled once at import time. A run of
+# dots/underscores/spaces/newlines counts as a single artifact, so one
+# scan replaces the four per-pattern count() passes over the text.
+_ARTIFACT_RE = re.compile(r'\.{3,}|_{3,}| {3,}|\n{3,}')
+_WORD_RE = re.compile(r'\b[a-zA-Z]{2,}\b')
+
+# WordprocessingML namespace for streaming DOCX parsing
+_DOCX_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+
+# Lazily imported extraction backends, cached after first use.
+# pdfplumber (via pdfminer.six) is expensive to import, so code paths
+# that never touch PDF files skip that cost entirely.
+_pdfplumber = None
+_pypdfium2 = None
+
+
+def _get_pdfplumber():
+    """Import pdfplumber on first use and cache the module."""
+    global _pdfplumber
+    if _pdfplumber is None:
+        import pdfplumber
+        _pdfplumber = pdfplumber
+    return _pdfplumber
+
+
+def _get_pypdfium2():
+    """Import pypdfium2 on first use and cache the module."""
+    global _pypdfium2
+    if _pypdfium2 is None:
+        import pypdfium2
+        _pypdfium2 = pypdfium2
+    return _pypdfium2
+
+
+# Shared HTTP session for Nutrient API calls, created on first use.
+_session = None
+
+
+def _get_session():
+    """
+    Get the shared HTTP session for Nutrient API calls.
+
+    Reusing one session keeps TCP/TLS connections alive across OCR calls
+    (one handshake per batch instead of one per document) and adds bounded
+    exponential backoff for transient server errors.
+    """
+    global _session
+    if _session is None:
+        import requests
+        from requests.adapters import HTTPAdapter, Retry
+
+        session = requests.Session()
+        session.mount('https://', HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+            ),
+        ))
+        _session = session
+    return _session
+
+
+def _fast_extract_pdf(file_path: str) -> str:
+    """
+    Fast text-layer extraction using pypdfium2 (no layout analysis).
+
+    Args:
+        file_path: Path to the PDF file
+
+    Returns:
+        Extracted text, or an empty string when pypdfium2 is unavailable
+        or extraction fails (callers fall back to pdfplumber)
+    """
+    try:
+        pdfium = _get_pypdfium2()
+    except ImportError:
+        return ""
+
+    try:
+        pdf = pdfium.PdfDocument(file_path)
+        try:
+            text_content = []
+            for page in pdf:
+                page_text = page.get_textpage().get_text_bounded()
+                if page_text and page_text.strip():
+                    # Clean up whitespace while preserving structure
+                    cleaned_text = '\n'.join(line.strip() for line in page_text.split('\n') if line.strip())
+                    text_content.append(cleaned_text)
+            return '\n\n'.join(text_content)
+        finally:
+            pdf.close()
+    except Exception as e:
+        logger.warning(f"Fast PDF extraction failed, falling back to pdfplumber: {str(e)}")
+        return ""
+
 
 def extract_text_pdf(file_path: str) -> str:
     """
-    Extract text from PDF file using pdfplumber.
-    
+    Extract text from PDF file.
+
+    Uses a two-tier strategy: the pypdfium2 text layer first (fast path
+    for born-digital PDFs), falling back to pdfplumber's layout-aware
+    extraction when the fast result looks too poor to use.
+
     Args:
         file_path: Path to the PDF file
-        
+
     Returns:
         Extracted text as string
-        
+
     Raises:
         Exception: If PDF extraction fails
     """
     try:
-        import pdfplumber
-        
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"PDF file not found: {file_path}")
-        
+
+        # Tier 1: fast text-layer extraction
+        fast_text = _fast_extract_pdf(file_path)
+        if len(fast_text.strip()) >= 50 and not needs_nutrient_ocr(fast_text):
+            fast_text = fast_text.replace('\x00', '')  # Remove null characters
+            fast_text = fast_text.replace('\ufeff', '')  # Remove BOM
+            logger.info(f"Successfully extracted {len(fast_text)} characters from PDF (fast path)")
+            return fast_text
+
+        # Tier 2: layout-aware pdfplumber extraction
+        pdfplumber = _get_pdfplumber()
+
         text_content = []
-        
+
         with pdfplumber.open(file_path) as pdf:
             if not pdf.pages:
                 raise ValueError("PDF file contains no pages")
@@ -74,63 +188,89 @@ def extract_text_pdf(file_path: str) -> str:
 
 def extract_text_docx(file_path: str) -> str:
     """
-    Extract text from DOCX file using python-docx.
-    
+    Extract text from DOCX file by streaming word/document.xml.
+
+    The document XML is parsed incrementally with iterparse instead of
+    building the full python-docx DOM, which bounds memory on large
+    files and avoids the python-docx import entirely. Paragraph and
+    table text is emitted in document order.
+
     Args:
         file_path: Path to the DOCX file
-        
+
     Returns:
         Extracted text as string
-        
+
     Raises:
         Exception: If DOCX extraction fails
     """
     try:
-        from docx import Document
-        
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"DOCX file not found: {file_path}")
-        
+
+        w_t = _DOCX_NS + 't'
+        w_p = _DOCX_NS + 'p'
+        w_tbl = _DOCX_NS + 'tbl'
+        w_tr = _DOCX_NS + 'tr'
+        w_tc = _DOCX_NS + 'tc'
+
+        text_content = []
+        paragraph_runs = []
+        row_cells = []
+        cell_runs = []
+        table_depth = 0
+
         try:
-            doc = Document(file_path)
-        except Exception as e:
+            with zipfile.ZipFile(file_path) as archive, \
+                    archive.open('word/document.xml') as document_xml:
+                for event, element in ElementTree.iterparse(document_xml, events=('start', 'end')):
+                    if event == 'start':
+                        if element.tag == w_tbl:
+                            table_depth += 1
+                        continue
+
+                    if element.tag == w_t:
+                        # Text run; route to the current cell inside tables
+                        target = cell_runs if table_depth else paragraph_runs
+                        target.append(element.text or '')
+                    elif element.tag == w_p and not table_depth:
+                        paragraph = ''.join(paragraph_runs).strip()
+                        paragraph_runs.clear()
+                        if paragraph:
+                            text_content.append(paragraph)
+                    elif table_depth:
+                        if element.tag == w_tc:
+                            cell_text = ''.join(cell_runs).strip()
+                            cell_runs.clear()
+                            if cell_text:
+                                row_cells.append(cell_text)
+                        elif element.tag == w_tr:
+                            if row_cells:
+                                text_content.append(' | '.join(row_cells))
+                                row_cells.clear()
+                        elif element.tag == w_tbl:
+                            table_depth -= 1
+
+                    # Release processed elements to bound memory
+                    element.clear()
+        except (zipfile.BadZipFile, KeyError, ElementTree.ParseError) as e:
             raise ValueError(f"Invalid DOCX file format: {str(e)}")
-        
-        text_content = []
-        
-        # Extract text from paragraphs
-        for paragraph in doc.paragraphs:
-            if paragraph.text.strip():
-                text_content.append(paragraph.text.strip())
-        
-        # Extract text from tables
-        for table in doc.tables:
-            for row in table.rows:
-                row_text = []
-                for cell in row.cells:
-                    cell_text = cell.text.strip()
-                    if cell_text:
-                        row_text.append(cell_text)
-                if row_text:
-                    text_content.append(' | '.join(row_text))
-        
+
         if not text_content:
             raise ValueError("No text could be extracted from the DOCX file")
-        
+
         # Join paragraphs with single newline to preserve structure
         full_text = '\n'.join(text_content)
-        
+
         # Clean up common artifacts
         full_text = full_text.replace('\x00', '')  # Remove null characters
         full_text = full_text.replace('\ufeff', '')  # Remove BOM
         full_text = full_text.replace('\r\n', '\n')  # Normalize line endings
         full_text = full_text.replace('\r', '\n')
-        
+
         logger.info(f"Successfully extracted {len(full_text)} characters from DOCX")
         return full_text
-        
-    except ImportError:
-        raise ImportError("python-docx library is required for DOCX extraction. Install with: pip install python-docx")
+
     except Exception as e:
         logger.error(f"DOCX extraction failed for {file_path}: {str(e)}")
         raise Exception(f"Failed to extract text from DOCX: {str(e)}")
@@ -172,15 +312,9 @@ def needs_nutrient_ocr(text: str) -> bool:
         logger.info("Many short lines detected (possible multi-column), recommending Nutrient OCR")
         return True
     
-    # Check for formatting artifacts
-    artifact_patterns = [
-        '...',  # Excessive dots
-        '___',  # Excessive underscores
-        '   ',  # Multiple spaces
-        '\n\n\n',  # Excessive newlines
-    ]
-    
-    artifact_count = sum(text.count(pattern) for pattern in artifact_patterns)
+    # Check for formatting artifacts (excessive dots, underscores,
+    # spaces or newlines) in a single pass
+    artifact_count = len(_ARTIFACT_RE.findall(text))
     if artifact_count > 10:
         logger.info(f"High formatting artifact count ({artifact_count}), recommending Nutrient OCR")
         return True
@@ -194,9 +328,7 @@ def needs_nutrient_ocr(text: str) -> bool:
             return True
     
     # Check for readable text patterns
-    import re
-    word_pattern = re.compile(r'\b[a-zA-Z]{2,}\b')
-    words = word_pattern.findall(text)
+    words = _WORD_RE.findall(text)
     
     if len(words) < 20:  # Too few recognizable words
         logger.info(f"Too few recognizable words ({len(words)}), recommending Nutrient OCR")
@@ -214,27 +346,36 @@ def needs_nutrient_ocr(text: str) -> bool:
     return False
 
 
-def call_nutrient_ocr(file_path: str, api_key: str) -> str:
+def call_nutrient_ocr(file_path: str, api_key: str, *, _file_bytes: Optional[bytes] = None) -> str:
     """
     Call Nutrient OCR service for text extraction fallback.
-    
+
     Args:
         file_path: Path to the file for OCR
         api_key: Nutrient API key
-        
+        _file_bytes: Pre-read file content (internal); skips the
+            filesystem entirely when the caller already holds the bytes
+
     Returns:
         OCR extracted text as string
-        
+
     Raises:
         Exception: If Nutrient API call fails
     """
     try:
         import requests
         import time
-        
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"File not found: {file_path}")
-        
+
+        if _file_bytes is None:
+            # Single os.stat call instead of an exists() + open() probe
+            try:
+                file_stat = os.stat(file_path)
+            except FileNotFoundError:
+                raise FileNotFoundError(f"File not found: {file_path}")
+
+            if file_stat.st_size == 0:
+                raise ValueError(f"File is empty: {file_path}")
+
         if not api_key:
             raise ValueError("Nutrient API key is required")
         
@@ -247,98 +388,105 @@ def call_nutrient_ocr(file_path: str, api_key: str) -> str:
         
         # Prepare multipart form data
         try:
-            with open(file_path, 'rb') as f:
-                files = {
-                    'file': (os.path.basename(file_path), f, 'application/octet-stream')
-                }
-                
-                # Instructions for OCR text extraction
-                instructions = {
-                    "parts": [
-                        {
-                            "file": "file",
-                            "pages": {
-                                "start": 0,
-                                "end": -1
-                            }
-                        }
-                    ],
-                    "actions": [
-                        {
-                            "type": "ocr",
-                            "language": "english"
-                        },
-                        {
-                            "type": "export",
-                            "format": "txt"
+            if _file_bytes is not None:
+                file_bytes = _file_bytes
+            else:
+                with open(file_path, 'rb') as f:
+                    file_bytes = f.read()
+
+            # Passing bytes (not a file handle) keeps the payload
+            # re-sendable across retry attempts
+            files = {
+                'file': (os.path.basename(file_path), file_bytes, 'application/octet-stream')
+            }
+
+            # Instructions for OCR text extraction
+            instructions = {
+                "parts": [
+                    {
+                        "file": "file",
+                        "pages": {
+                            "start": 0,
+                            "end": -1
                         }
-                    ]
-                }
-                
-                data = {
-                    'instructions': str(instructions).replace("'", '"')
-                }
-                
-                # Make API request with retry logic
-                max_retries = 2
-                retry_delay = 1
-                
-                for attempt in range(max_retries + 1):
-                    try:
-                        logger.info(f"Calling Nutrient OCR API (attempt {attempt + 1})")
-                        response = requests.post(url, headers=headers, files=files, data=data, timeout=60)
-                        
-                        if response.status_code == 200:
-                            # Nutrient returns the processed text directly
-                            extracted_text = response.text.strip()
-                            
-                            if not extracted_text:
-                                raise ValueError("Nutrient returned empty text")
-                            
-                            logger.info(f"Successfully extracted {len(extracted_text)} characters via Nutrient OCR")
-                            return extracted_text
-                        
-                        elif response.status_code == 429:  # Rate limit
-                            if attempt < max_retries:
-                                wait_time = retry_delay * (2 ** attempt)
-                                logger.warning(f"Rate limited, waiting {wait_time} seconds before retry")
-                                time.sleep(wait_time)
-                                continue
-                            else:
-                                raise Exception("Rate limit exceeded, max retries reached")
-                        
-                        elif response.status_code == 401:
-                            raise Exception("Invalid Nutrient API key")
+                    }
+                ],
+                "actions": [
+                    {
+                        "type": "ocr",
+                        "language": "english"
+                    },
+                    {
+                        "type": "export",
+                        "format": "txt"
+                    }
+                ]
+            }
+            
+            data = {
+                'instructions': str(instructions).replace("'", '"')
+            }
+            
+            # Make API request with retry logic
+            max_retries = 2
+            retry_delay = 1
+            
+            for attempt in range(max_retries + 1):
+                try:
+                    logger.info(f"Calling Nutrient OCR API (attempt {attempt + 1})")
+                    response = _get_session().post(url, headers=headers, files=files, data=data, timeout=(5, 60))
+                    
+                    if response.status_code == 200:
+                        # Nutrient returns the processed text directly
+                        extracted_text = response.text.strip()
                         
-                        elif response.status_code == 400:
-                            try:
-                                error_data = response.json()
-                                error_msg = error_data.get('error', 'Bad request')
-                            except:
-                                error_msg = response.text
-                            raise Exception(f"Nutrient API error: {error_msg}")
+                        if not extracted_text:
+                            raise ValueError("Nutrient returned empty text")
                         
-                        else:
-                            raise Exception(f"Nutrient API returned status {response.status_code}: {response.text}")
-                            
-                    except requests.exceptions.Timeout:
-                        if attempt < max_retries:
-                            logger.warning(f"Request timeout, retrying in {retry_delay} seconds")
-                            time.sleep(retry_delay)
-                            continue
-                        else:
-                            raise Exception("Nutrient API request timed out after retries")
-                            
-                    except requests.exceptions.ConnectionError:
+                        logger.info(f"Successfully extracted {len(extracted_text)} characters via Nutrient OCR")
+                        return extracted_text
+                    
+                    elif response.status_code == 429:  # Rate limit
                         if attempt < max_retries:
-                            logger.warning(f"Connection error, retrying in {retry_delay} seconds")
-                            time.sleep(retry_delay)
+                            wait_time = retry_delay * (2 ** attempt)
+                            logger.warning(f"Rate limited, waiting {wait_time} seconds before retry")
+                            time.sleep(wait_time)
                             continue
                         else:
-                            raise Exception("Failed to connect to Nutrient API after retries")
-                
-                raise Exception("Nutrient OCR failed after all retry attempts")
-                
+                            raise Exception("Rate limit exceeded, max retries reached")
+                    
+                    elif response.status_code == 401:
+                        raise Exception("Invalid Nutrient API key")
+                    
+                    elif response.status_code == 400:
+                        try:
+                            error_data = response.json()
+                            error_msg = error_data.get('error', 'Bad request')
+                        except:
+                            error_msg = response.text
+                        raise Exception(f"Nutrient API error: {error_msg}")
+                    
+                    else:
+                        raise Exception(f"Nutrient API returned status {response.status_code}: {response.text}")
+                        
+                except requests.exceptions.Timeout:
+                    if attempt < max_retries:
+                        logger.warning(f"Request timeout, retrying in {retry_delay} seconds")
+                        time.sleep(retry_delay)
+                        continue
+                    else:
+                        raise Exception("Nutrient API request timed out after retries")
+                        
+                except requests.exceptions.ConnectionError:
+                    if attempt < max_retries:
+                        logger.warning(f"Connection error, retrying in {retry_delay} seconds")
+                        time.sleep(retry_delay)
+                        continue
+                    else:
+                        raise Exception("Failed to connect to Nutrient API after retries")
+            
+            raise Exception("Nutrient OCR failed after all retry attempts")
+            
         except Exception as e:
             if "File not found" in str(e) or "API key" in str(e):
                 raise
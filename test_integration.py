@@ -13,6 +13,7 @@ import tempfile
 import shutil
 import json
 import time
+import zipfile
 from unittest.mock import patch, MagicMock, mock_open
 from pathlib import Path
 
@@ -204,41 +205,22 @@ Requirements:
         
         print("✅ Job comparison workflow test passed")
     
-    @patch('tts_video.asyncio.run')
-    @patch('tts_video.ColorClip')
-    @patch('tts_video.TextClip')
-    @patch('tts_video.CompositeVideoClip')
-    @patch('tts_video.AudioFileClip')
+    @patch('tts_video._drawtext_supported', return_value=True)
+    @patch('tts_video._audio_duration', return_value=1.0)
+    @patch('tts_video._cache_store')
+    @patch('tts_video._run_ffmpeg')
+    @patch('tts_video.synthesize_audio_parallel')
     @patch('os.path.exists')
-    def test_video_generation_workflow(self, mock_exists, mock_audio_clip, mock_composite, 
-                                     mock_text_clip, mock_color_clip, mock_asyncio_run):
+    def test_video_generation_workflow(self, mock_exists, mock_synthesize, mock_run_ffmpeg, mock_cache_store, mock_audio_duration, mock_drawtext):
         """Test complete video generation workflow."""
-        # Mock file existence check
-        mock_exists.return_value = True
-        
-        # Mock TTS synthesis
-        mock_asyncio_run.return_value = None
-        
-        # Mock moviepy components
-        mock_background = MagicMock()
-        mock_color_clip.return_value = mock_background
-        
-        mock_text = MagicMock()
-        mock_text.set_duration.return_value = mock_text
-        mock_text.set_start.return_value = mock_text
-        mock_text.set_position.return_value = mock_text
-        mock_text.fadein.return_value = mock_text
-        mock_text.fadeout.return_value = mock_text
-        mock_text_clip.return_value = mock_text
-        
-        mock_audio = MagicMock()
-        mock_audio.duration = 10.0
-        mock_audio_clip.return_value = mock_audio
-        
-        mock_video = MagicMock()
-        mock_composite.return_value = mock_video
-        mock_video.set_audio.return_value = mock_video
-        
+        # Mock file existence, but report the video cache as cold so the
+        # full pipeline runs; caching the (mocked) output is a no-op
+        mock_exists.side_effect = lambda path: 'cv_video_cache' not in path
+
+        # Mock TTS synthesis and ffmpeg rendering
+        mock_synthesize.return_value = None
+        mock_run_ffmpeg.return_value = None
+
         # Sample script data
         script_data = {
             'intro': {'text': 'Hi, I am John Doe', 'duration': 2.5},
@@ -259,11 +241,13 @@ Requirements:
         self.assertTrue(video_path.endswith("pitch_video.mp4"))
         self.assertIn(self.temp_dir, video_path)
         
-        # Verify components were called
-        mock_asyncio_run.assert_called()  # TTS synthesis
-        mock_color_clip.assert_called()   # Background
-        mock_text_clip.assert_called()    # Text animations
-        mock_composite.assert_called()    # Video composition
+        # Verify pipeline stages ran
+        mock_synthesize.assert_called()   # TTS synthesis
+        # ffmpeg runs twice: silent slide render, then audio mux
+        self.assertEqual(mock_run_ffmpeg.call_count, 2)
+        slide_command = mock_run_ffmpeg.call_args_list[0].args[0]
+        self.assertIn('lavfi', slide_command)
+        self.assertTrue(any('drawtext=' in arg for arg in slide_command))
         
         print("✅ Video generation workflow test passed")
     
@@ -398,8 +382,8 @@ class TestAPIIntegrationRobustness(unittest.TestCase):
         
         print("✅ Malformed response handling test passed")
     
-    @patch('requests.post')
-    def test_nutrient_ocr_error_handling(self, mock_requests):
+    @patch('parsing._get_session')
+    def test_nutrient_ocr_error_handling(self, mock_get_session):
         """Test Nutrient OCR error handling."""
         # Create test file
         test_file = os.path.join(self.temp_dir, "test.pdf")
@@ -409,7 +393,7 @@ class TestAPIIntegrationRobustness(unittest.TestCase):
         # Test rate limiting
         mock_response = MagicMock()
         mock_response.status_code = 429
-        mock_requests.return_value = mock_response
+        mock_get_session.return_value.post.return_value = mock_response
         
         with self.assertRaises(Exception) as context:
             parsing.call_nutrient_ocr(test_file, "test_api_key")
@@ -482,24 +466,20 @@ class TestFileProcessingPipeline(unittest.TestCase):
         
         print("✅ PDF processing pipeline test passed")
     
-    @patch('docx.Document')
-    def test_docx_processing_pipeline(self, mock_document):
+    def test_docx_processing_pipeline(self):
         """Test DOCX file processing pipeline."""
-        # Mock DOCX structure
-        mock_paragraph = MagicMock()
-        mock_paragraph.text = "Sample resume text from DOCX"
-        
-        mock_doc = MagicMock()
-        mock_doc.paragraphs = [mock_paragraph]
-        mock_doc.tables = []
-        
-        mock_document.return_value = mock_doc
+        # Create a minimal real DOCX archive for the streaming parser
+        document_xml = (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+            '<w:body><w:p><w:r><w:t>Sample resume text from DOCX</w:t></w:r></w:p></w:body>'
+            '</w:document>'
+        )
         
-        # Create test DOCX file
         test_file = os.path.join(self.temp_dir, "test.docx")
-        with open(test_file, 'w') as f:
-            f.write("dummy docx content")
-        
+        with zipfile.ZipFile(test_file, 'w') as archive:
+            archive.writestr('word/document.xml', document_xml)
+
         # Test extraction
         extracted_text = parsing.extract_text_docx(test_file)
         
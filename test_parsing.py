@@ -8,27 +8,106 @@ text quality assessment, and Nutrient OCR integration.
 import unittest
 import os
 import tempfile
+import weakref
+import zipfile
 from unittest.mock import patch, mock_open, MagicMock
 import json
 
 from parsing import extract_text_pdf, extract_text_docx, needs_nutrient_ocr, call_nutrient_ocr
 
+# Synthetic fixtures for the quality-assessment tests, built once at
+# module load instead of inside each test body.
+_WHITESPACE_FIXTURE = "   ".join("abcdefghijklmnopqrst")
+_SHORT_LINES_FIXTURE = "\n".join(["a", "b", "c", "d", "e", "f", "g", "h", "i", "j"] * 3)
+_ARTIFACT_FIXTURE = "Resume... John Doe___ Software Engineer   Experience\n\n\nSkills..." * 5
+_GOOD_QUALITY_FIXTURE = """John Doe
+Software Engineer with 5 years of experience in full-stack development.
+
+Experience:
+Senior Developer at Tech Corp (2020-2023)
+Led team of 5 developers on major projects and implemented microservices architecture.
+Developed scalable web applications using modern frameworks and cloud technologies.
+
+Skills:
+Python, JavaScript, React, Node.js, AWS, Docker, Kubernetes
+Database design and optimization, API development, Agile methodologies
+
+Education:
+Bachelor of Computer Science
+University of Technology (2016-2020)
+Graduated with honors, relevant coursework in software engineering and algorithms."""
+
 
 class TestTextExtraction(unittest.TestCase):
     """Test cases for text extraction functions."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create one shared temp root, cleaned up once per class."""
+        cls._temp_root = tempfile.TemporaryDirectory()
+        weakref.finalize(cls, cls._temp_root.cleanup)
+
     def setUp(self):
         """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
+        self.temp_dir = os.path.join(self._temp_root.name, self.id().rsplit('.', 1)[-1])
+        os.mkdir(self.temp_dir)
         self.sample_text = "John Doe\nSoftware Engineer\nExperience: 5 years\nSkills: Python, JavaScript"
-        
-    def tearDown(self):
-        """Clean up test fixtures."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    @staticmethod
+    def _mock_pdfium_module(page_text):
+        """Build a mock pypdfium2 module whose single page yields page_text."""
+        mock_page = MagicMock()
+        mock_page.get_textpage.return_value.get_text_bounded.return_value = page_text
+
+        mock_pdf = MagicMock()
+        mock_pdf.__iter__ = MagicMock(return_value=iter([mock_page]))
+
+        mock_pdfium = MagicMock()
+        mock_pdfium.PdfDocument.return_value = mock_pdf
+        return mock_pdfium
+
+    @patch('parsing._get_pypdfium2')
+    def test_extract_text_pdf_fast_path(self, mock_get_pypdfium2):
+        """Test PDF extraction via the pypdfium2 fast path."""
+        mock_get_pypdfium2.return_value = self._mock_pdfium_module(_GOOD_QUALITY_FIXTURE)
+
+        test_file = os.path.join(self.temp_dir, "digital.pdf")
+        with open(test_file, 'w') as f:
+            f.write("dummy pdf content")
+
+        result = extract_text_pdf(test_file)
+
+        self.assertIn("John Doe", result)
+        self.assertIn("Software Engineer", result)
+
+    @patch('pdfplumber.open')
+    @patch('parsing._get_pypdfium2')
+    def test_extract_text_pdf_falls_back_to_pdfplumber(self, mock_get_pypdfium2, mock_pdfplumber_open):
+        """Test fallback to pdfplumber when the fast path yields nothing."""
+        mock_get_pypdfium2.return_value = self._mock_pdfium_module("")
+
+        mock_page = MagicMock()
+        mock_page.extract_text.return_value = self.sample_text
+
+        mock_pdf = MagicMock()
+        mock_pdf.pages = [mock_page]
+        mock_pdf.__enter__ = MagicMock(return_value=mock_pdf)
+        mock_pdf.__exit__ = MagicMock(return_value=None)
+
+        mock_pdfplumber_open.return_value = mock_pdf
+
+        test_file = os.path.join(self.temp_dir, "scanned.pdf")
+        with open(test_file, 'w') as f:
+            f.write("dummy pdf content")
+
+        result = extract_text_pdf(test_file)
+
+        self.assertEqual(result, self.sample_text)
+        mock_pdfplumber_open.assert_called_once_with(test_file)
 
     @patch('pdfplumber.open')
-    def test_extract_text_pdf_success(self, mock_pdfplumber_open):
+    @patch('parsing._get_pypdfium2', side_effect=ImportError)
+    def test_extract_text_pdf_success(self, mock_get_pypdfium2, mock_pdfplumber_open):
         """Test successful PDF text extraction."""
         # Mock PDF structure
         mock_page = MagicMock()
@@ -58,7 +137,8 @@ class TestTextExtraction(unittest.TestCase):
         self.assertIn("PDF file not found", str(context.exception))
 
     @patch('pdfplumber.open')
-    def test_extract_text_pdf_empty_pages(self, mock_pdfplumber_open):
+    @patch('parsing._get_pypdfium2', side_effect=ImportError)
+    def test_extract_text_pdf_empty_pages(self, mock_get_pypdfium2, mock_pdfplumber_open):
         """Test PDF extraction with no pages."""
         mock_pdf = MagicMock()
         mock_pdf.pages = []
@@ -75,30 +155,29 @@ class TestTextExtraction(unittest.TestCase):
             extract_text_pdf(test_file)
         self.assertIn("PDF file contains no pages", str(context.exception))
 
-    @patch('docx.Document')
-    def test_extract_text_docx_success(self, mock_document_class):
+    @staticmethod
+    def _write_docx(file_path, body_xml):
+        """Write a minimal DOCX archive containing the given body XML."""
+        document_xml = (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+            f'<w:body>{body_xml}</w:body></w:document>'
+        )
+        with zipfile.ZipFile(file_path, 'w') as archive:
+            archive.writestr('word/document.xml', document_xml)
+
+    def test_extract_text_docx_success(self):
         """Test successful DOCX text extraction."""
-        # Mock document structure
-        mock_paragraph1 = MagicMock()
-        mock_paragraph1.text = "John Doe"
-        mock_paragraph2 = MagicMock()
-        mock_paragraph2.text = "Software Engineer"
-        
-        mock_doc = MagicMock()
-        mock_doc.paragraphs = [mock_paragraph1, mock_paragraph2]
-        mock_doc.tables = []
-        
-        mock_document_class.return_value = mock_doc
-        
-        # Test extraction
         test_file = os.path.join(self.temp_dir, "test.docx")
-        with open(test_file, 'w') as f:
-            f.write("dummy docx content")
-            
+        self._write_docx(
+            test_file,
+            '<w:p><w:r><w:t>John Doe</w:t></w:r></w:p>'
+            '<w:p><w:r><w:t>Software Engineer</w:t></w:r></w:p>'
+        )
+
         result = extract_text_docx(test_file)
-        
+
         self.assertEqual(result, "John Doe\nSoftware Engineer")
-        mock_document_class.assert_called_once_with(test_file)
 
     def test_extract_text_docx_file_not_found(self):
         """Test DOCX extraction with non-existent file."""
@@ -106,35 +185,31 @@ class TestTextExtraction(unittest.TestCase):
             extract_text_docx("nonexistent.docx")
         self.assertIn("DOCX file not found", str(context.exception))
 
-    @patch('docx.Document')
-    def test_extract_text_docx_with_table(self, mock_document_class):
+    def test_extract_text_docx_with_table(self):
         """Test DOCX extraction with table content."""
-        # Mock table structure
-        mock_cell1 = MagicMock()
-        mock_cell1.text = "Skill"
-        mock_cell2 = MagicMock()
-        mock_cell2.text = "Level"
-        
-        mock_row = MagicMock()
-        mock_row.cells = [mock_cell1, mock_cell2]
-        
-        mock_table = MagicMock()
-        mock_table.rows = [mock_row]
-        
-        mock_doc = MagicMock()
-        mock_doc.paragraphs = []
-        mock_doc.tables = [mock_table]
-        
-        mock_document_class.return_value = mock_doc
-        
         test_file = os.path.join(self.temp_dir, "test_table.docx")
-        with open(test_file, 'w') as f:
-            f.write("dummy")
-            
+        self._write_docx(
+            test_file,
+            '<w:tbl><w:tr>'
+            '<w:tc><w:p><w:r><w:t>Skill</w:t></w:r></w:p></w:tc>'
+            '<w:tc><w:p><w:r><w:t>Level</w:t></w:r></w:p></w:tc>'
+            '</w:tr></w:tbl>'
+        )
+
         result = extract_text_docx(test_file)
-        
+
         self.assertEqual(result, "Skill | Level")
 
+    def test_extract_text_docx_invalid_file(self):
+        """Test DOCX extraction with a file that is not a valid archive."""
+        test_file = os.path.join(self.temp_dir, "broken.docx")
+        with open(test_file, 'w') as f:
+            f.write("not a zip archive")
+
+        with self.assertRaises(Exception) as context:
+            extract_text_docx(test_file)
+        self.assertIn("Invalid DOCX file format", str(context.exception))
+
 
 class TestTextQualityAssessment(unittest.TestCase):
     """Test cases for text quality assessment."""
@@ -151,38 +226,19 @@ class TestTextQualityAssessment(unittest.TestCase):
     
     def test_needs_nutrient_ocr_high_whitespace(self):
         """Test quality assessment with excessive whitespace."""
-        whitespace_text = "a   b   c   d   e   f   g   h   i   j   k   l   m   n   o   p   q   r   s   t"
-        self.assertTrue(needs_nutrient_ocr(whitespace_text))
-    
+        self.assertTrue(needs_nutrient_ocr(_WHITESPACE_FIXTURE))
+
     def test_needs_nutrient_ocr_many_short_lines(self):
         """Test quality assessment with many short lines (multi-column indicator)."""
-        short_lines = "\n".join(["a", "b", "c", "d", "e", "f", "g", "h", "i", "j"] * 3)
-        self.assertTrue(needs_nutrient_ocr(short_lines))
-    
+        self.assertTrue(needs_nutrient_ocr(_SHORT_LINES_FIXTURE))
+
     def test_needs_nutrient_ocr_formatting_artifacts(self):
         """Test quality assessment with formatting artifacts."""
-        artifact_text = "Resume... John Doe___ Software Engineer   Experience\n\n\nSkills..." * 5
-        self.assertTrue(needs_nutrient_ocr(artifact_text))
+        self.assertTrue(needs_nutrient_ocr(_ARTIFACT_FIXTURE))
     
     def test_needs_nutrient_ocr_good_quality_text(self):
         """Test quality assessment with good quality text."""
-        good_text = """John Doe
-Software Engineer with 5 years of experience in full-stack development.
-
-Experience:
-Senior Developer at Tech Corp (2020-2023)
-Led team of 5 developers on major projects and implemented microservices architecture.
-Developed scalable web applications using modern frameworks and cloud technologies.
-
-Skills:
-Python, JavaScript, React, Node.js, AWS, Docker, Kubernetes
-Database design and optimization, API development, Agile methodologies
-
-Education:
-Bachelor of Computer Science
-University of Technology (2016-2020)
-Graduated with honors, relevant coursework in software engineering and algorithms."""
-        self.assertFalse(needs_nutrient_ocr(good_text))
+        self.assertFalse(needs_nutrient_ocr(_GOOD_QUALITY_FIXTURE))
     
     def test_needs_nutrient_ocr_few_words(self):
         """Test quality assessment with too few recognizable words."""
@@ -192,35 +248,29 @@ Graduated with honors, relevant coursework in software engineering and algorithm
 
 class TestNutrientOCR(unittest.TestCase):
     """Test cases for Nutrient OCR integration."""
-    
+
     def setUp(self):
         """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
+        self.test_file = "/virtual/test.pdf"
         self.api_key = "test_nutrient_api_key"
-        
-    def tearDown(self):
-        """Clean up test fixtures."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
 
-    @patch('requests.post')
-    def test_call_nutrient_ocr_success(self, mock_requests_post):
+    def _mock_stat(self, size=1024):
+        """Build a fake os.stat result for a non-empty file."""
+        return MagicMock(st_size=size)
+
+    @patch('parsing._get_session')
+    def test_call_nutrient_ocr_success(self, mock_get_session):
         """Test successful Nutrient OCR call."""
-        # Mock file operations
-        test_file = os.path.join(self.temp_dir, "test.pdf")
-        with open(test_file, 'wb') as f:
-            f.write(b"dummy pdf content")
-        
         # Mock successful API response
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.text = "Extracted text from Nutrient OCR"
-        mock_requests_post.return_value = mock_response
-        
-        result = call_nutrient_ocr(test_file, self.api_key)
-        
+        mock_get_session.return_value.post.return_value = mock_response
+
+        result = call_nutrient_ocr(self.test_file, self.api_key, _file_bytes=b"dummy pdf content")
+
         self.assertEqual(result, "Extracted text from Nutrient OCR")
-        mock_requests_post.assert_called_once()
+        mock_get_session.return_value.post.assert_called_once()
 
     def test_call_nutrient_ocr_file_not_found(self):
         """Test Nutrient OCR with non-existent file."""
@@ -228,48 +278,45 @@ class TestNutrientOCR(unittest.TestCase):
             call_nutrient_ocr("nonexistent.pdf", self.api_key)
         self.assertIn("File not found", str(context.exception))
 
+    @patch('parsing.os.stat')
+    def test_call_nutrient_ocr_empty_file(self, mock_stat):
+        """Test Nutrient OCR with an empty file."""
+        mock_stat.return_value = self._mock_stat(size=0)
+
+        with self.assertRaises(Exception) as context:
+            call_nutrient_ocr(self.test_file, self.api_key)
+        self.assertIn("File is empty", str(context.exception))
+
     def test_call_nutrient_ocr_missing_credentials(self):
         """Test Nutrient OCR with missing credentials."""
-        test_file = os.path.join(self.temp_dir, "test.pdf")
-        with open(test_file, 'w') as f:
-            f.write("dummy")
-            
         with self.assertRaises(Exception) as context:
-            call_nutrient_ocr(test_file, "")
+            call_nutrient_ocr(self.test_file, "", _file_bytes=b"dummy")
         self.assertIn("API key is required", str(context.exception))
 
-    @patch('requests.post')
-    def test_call_nutrient_ocr_rate_limit(self, mock_requests_post):
+    @patch('parsing._get_session')
+    def test_call_nutrient_ocr_rate_limit(self, mock_get_session):
         """Test Nutrient OCR with rate limiting."""
-        test_file = os.path.join(self.temp_dir, "test.pdf")
-        with open(test_file, 'wb') as f:
-            f.write(b"dummy")
-        
         # Mock rate limit response
         mock_response = MagicMock()
         mock_response.status_code = 429
-        mock_requests_post.return_value = mock_response
-        
+        mock_get_session.return_value.post.return_value = mock_response
+
         with self.assertRaises(Exception) as context:
-            call_nutrient_ocr(test_file, self.api_key)
-        
+            call_nutrient_ocr(self.test_file, self.api_key, _file_bytes=b"dummy")
+
         self.assertIn("Rate limit", str(context.exception))
 
-    @patch('requests.post')
-    def test_call_nutrient_ocr_invalid_credentials(self, mock_requests_post):
+    @patch('parsing._get_session')
+    def test_call_nutrient_ocr_invalid_credentials(self, mock_get_session):
         """Test Nutrient OCR with invalid credentials."""
-        test_file = os.path.join(self.temp_dir, "test.pdf")
-        with open(test_file, 'wb') as f:
-            f.write(b"dummy")
-        
         # Mock unauthorized response
         mock_response = MagicMock()
         mock_response.status_code = 401
-        mock_requests_post.return_value = mock_response
-        
+        mock_get_session.return_value.post.return_value = mock_response
+
         with self.assertRaises(Exception) as context:
-            call_nutrient_ocr(test_file, self.api_key)
-        
+            call_nutrient_ocr(self.test_file, self.api_key, _file_bytes=b"dummy")
+
         self.assertIn("Invalid Nutrient API key", str(context.exception))
 
 
@@ -9,10 +9,14 @@ import unittest
 from unittest.mock import patch, MagicMock, AsyncMock
 import os
 import tempfile
-import shutil
+import weakref
 from tts_video import (
     synthesize_audio,
-    create_animated_slides,
+    synthesize_audio_batch,
+    _tts_cache_path,
+    _video_cache_path,
+    _build_drawtext_filtergraph,
+    _probe_encoder,
     make_video,
     generate_pitch_video,
     calculate_optimal_duration,
@@ -26,16 +30,25 @@ from tts_video import (
 class TestAudioSynthesis(unittest.TestCase):
     """Test text-to-speech audio generation."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create one shared temp root, cleaned up once per class."""
+        cls._temp_root = tempfile.TemporaryDirectory()
+        weakref.finalize(cls, cls._temp_root.cleanup)
+
     def setUp(self):
         """Set up test environment."""
-        self.temp_dir = tempfile.mkdtemp()
+        self.temp_dir = os.path.join(self._temp_root.name, self.id().rsplit('.', 1)[-1])
+        os.mkdir(self.temp_dir)
         self.audio_path = os.path.join(self.temp_dir, "test_audio.wav")
-    
-    def tearDown(self):
-        """Clean up test environment."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-    
-    @patch('tts_video.asyncio.run')
+        # Isolate the TTS cache per test so hits/misses are deterministic
+        env_patcher = patch.dict(
+            'os.environ', {'CV_TTS_CACHE': os.path.join(self.temp_dir, 'tts_cache')}
+        )
+        env_patcher.start()
+        self.addCleanup(env_patcher.stop)
+
+    @patch('tts_video._run_async')
     @patch('tts_video._synthesize_audio_async')
     def test_synthesize_audio_english(self, mock_async, mock_run):
         """Test English audio synthesis."""
@@ -46,11 +59,12 @@ class TestAudioSynthesis(unittest.TestCase):
         
         # Test synthesis
         synthesize_audio(test_text, self.audio_path, "en")
-        
+
         # Verify async function was called with correct parameters
         mock_run.assert_called_once()
+        mock_async.assert_called_once_with(test_text, self.audio_path, "en-US-AriaNeural")
         
-    @patch('tts_video.asyncio.run')
+    @patch('tts_video._run_async')
     @patch('tts_video._synthesize_audio_async')
     def test_synthesize_audio_romanian(self, mock_async, mock_run):
         """Test Romanian audio synthesis."""
@@ -61,11 +75,53 @@ class TestAudioSynthesis(unittest.TestCase):
         
         # Test synthesis
         synthesize_audio(test_text, self.audio_path, "ro")
-        
+
         # Verify async function was called
         mock_run.assert_called_once()
+        mock_async.assert_called_once_with(test_text, self.audio_path, "ro-RO-AlinaNeural")
+
+    @patch('tts_video._run_async')
+    def test_synthesize_audio_cache_hit(self, mock_run):
+        """Test that a cached (voice, text) pair skips synthesis."""
+        test_text = "Hello, I am a software developer."
+
+        # Seed the cache with pre-rendered audio for this pair
+        cache_path = _tts_cache_path(test_text, "en-US-AriaNeural")
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(cache_path, 'wb') as f:
+            f.write(b"cached audio bytes")
+
+        synthesize_audio(test_text, self.audio_path, "en")
+
+        # Cached audio is copied out without running edge-tts
+        mock_run.assert_not_called()
+        with open(self.audio_path, 'rb') as f:
+            self.assertEqual(f.read(), b"cached audio bytes")
     
-    @patch('tts_video.asyncio.run')
+    @patch('tts_video._run_async')
+    @patch('tts_video._synthesize_batch_async')
+    def test_synthesize_audio_batch(self, mock_batch_async, mock_run):
+        """Test batched audio synthesis runs on a single event loop."""
+        texts = ["First clip", "Second clip"]
+        paths = [os.path.join(self.temp_dir, f"clip_{i}.wav") for i in range(2)]
+
+        # Mock the async function
+        mock_run.return_value = None
+
+        # Test batch synthesis
+        synthesize_audio_batch(texts, paths, "en")
+
+        # Whole batch should go through one event-loop submission
+        mock_run.assert_called_once()
+
+    def test_synthesize_audio_batch_length_mismatch(self):
+        """Test batch synthesis with mismatched input lengths."""
+        with self.assertRaises(Exception) as context:
+            synthesize_audio_batch(["only text"], [], "en")
+
+        self.assertIn("same length", str(context.exception))
+
+    @patch('tts_video._run_async')
     def test_synthesize_audio_error_handling(self, mock_run):
         """Test error handling in audio synthesis."""
         mock_run.side_effect = Exception("TTS failed")
@@ -224,110 +280,190 @@ class TestScriptCombination(unittest.TestCase):
 class TestVideoGeneration(unittest.TestCase):
     """Test video generation functions."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create one shared temp root, cleaned up once per class."""
+        cls._temp_root = tempfile.TemporaryDirectory()
+        weakref.finalize(cls, cls._temp_root.cleanup)
+
     def setUp(self):
         """Set up test environment."""
-        self.temp_dir = tempfile.mkdtemp()
+        self.temp_dir = os.path.join(self._temp_root.name, self.id().rsplit('.', 1)[-1])
+        os.mkdir(self.temp_dir)
         self.script_data = {
             'intro': {'text': 'Hi, I am John Smith'},
             'skills': {'text': 'Python developer with 5 years experience'},
             'achievement': {'text': 'Led team of 10 developers'},
             'closing': {'text': 'Let\'s connect and discuss opportunities'}
         }
-    
-    def tearDown(self):
-        """Clean up test environment."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-    
-    @patch('tts_video.ColorClip')
-    @patch('tts_video.TextClip')
-    def test_create_animated_slides(self, mock_text_clip, mock_color_clip):
-        """Test animated slide creation."""
-        # Mock moviepy components
-        mock_background = MagicMock()
-        mock_color_clip.return_value = mock_background
-        
-        mock_text = MagicMock()
-        mock_text.set_duration.return_value = mock_text
-        mock_text.set_start.return_value = mock_text
-        mock_text.set_position.return_value = mock_text
-        mock_text.fadein.return_value = mock_text
-        mock_text.fadeout.return_value = mock_text
-        mock_text_clip.return_value = mock_text
-        
-        # Test slide creation
-        clips = create_animated_slides(self.script_data, 10.0)
-        
-        # Should return list of clips
-        self.assertIsInstance(clips, list)
-        self.assertGreater(len(clips), 0)
-        
-        # Background should be created
-        mock_color_clip.assert_called_once()
-    
-    @patch('tts_video.create_animated_slides')
-    @patch('tts_video.CompositeVideoClip')
-    @patch('tts_video.AudioFileClip')
+        # Isolate the video cache so tests never hit stale entries
+        env_patcher = patch.dict(
+            'os.environ',
+            {'CV_VIDEO_CACHE': os.path.join(self.temp_dir, 'video_cache')}
+        )
+        env_patcher.start()
+        self.addCleanup(env_patcher.stop)
+
+    def test_build_drawtext_filtergraph(self):
+        """Test drawtext filter chain construction."""
+        timing = {
+            'intro': {'start_time': 0.0, 'duration': 3.0},
+            'skills': {'start_time': 3.0, 'duration': 4.0},
+            'achievement': {'start_time': 7.0, 'duration': 2.0},
+            'closing': {'start_time': 9.0, 'duration': 1.0}
+        }
+
+        filtergraph = _build_drawtext_filtergraph(self.script_data, timing)
+
+        # One drawtext filter per segment, chained with commas
+        self.assertEqual(filtergraph.count('drawtext='), 4)
+        self.assertIn("text='Hi, I am John Smith'", filtergraph)
+        self.assertIn("enable='between(t,0.000,3.000)'", filtergraph)
+        self.assertIn('fontcolor=0x4CAF50', filtergraph)
+        # Apostrophes are escaped per filtergraph quoting rules
+        self.assertIn("Let'\\''s", filtergraph)
+
+    def test_build_drawtext_filtergraph_empty(self):
+        """Test filter construction with no usable segments."""
+        self.assertEqual(_build_drawtext_filtergraph({}, {}), "")
+
+    @patch('tts_video._drawtext_supported', return_value=True)
+    @patch('tts_video._run_ffmpeg')
+    @patch('tts_video._audio_duration')
     @patch('os.path.exists')
-    def test_make_video(self, mock_exists, mock_audio_clip, mock_composite, mock_slides):
+    def test_make_video(self, mock_exists, mock_duration, mock_run_ffmpeg, mock_drawtext):
         """Test video composition."""
         # Mock file existence
         mock_exists.return_value = True
-        
-        # Mock audio clip
-        mock_audio = MagicMock()
-        mock_audio.duration = 10.0
-        mock_audio_clip.return_value = mock_audio
-        
-        # Mock video clips
-        mock_slides.return_value = [MagicMock(), MagicMock()]
-        
-        # Mock composite video
-        mock_video = MagicMock()
-        mock_composite.return_value = mock_video
-        mock_video.set_audio.return_value = mock_video
-        
+
+        # Mock audio duration probe
+        mock_duration.return_value = 10.0
+
         audio_path = os.path.join(self.temp_dir, "test_audio.wav")
         video_path = os.path.join(self.temp_dir, "test_video.mp4")
-        
+
         # Test video creation
         make_video(audio_path, self.script_data, video_path)
-        
-        # Verify components were called
-        mock_audio_clip.assert_called_once_with(audio_path)
-        mock_slides.assert_called_once()
-        mock_composite.assert_called_once()
-        mock_video.write_videofile.assert_called_once()
-    
-    @patch('tts_video.make_video')
-    @patch('tts_video.synthesize_audio')
+
+        # A single ffmpeg invocation renders background, text, and audio
+        mock_duration.assert_called_once_with(audio_path)
+        mock_run_ffmpeg.assert_called_once()
+        command = mock_run_ffmpeg.call_args.args[0]
+        self.assertIn('lavfi', command)
+        self.assertIn(audio_path, command)
+        self.assertEqual(command[-1], video_path)
+
+    @patch('tts_video._drawtext_supported', return_value=True)
+    @patch('tts_video._probe_encoder', return_value='libx264')
+    @patch('tts_video._run_ffmpeg')
+    @patch('tts_video._audio_duration')
+    @patch('os.path.exists')
+    def test_make_video_fast_preset(self, mock_exists, mock_duration, mock_run_ffmpeg, mock_probe, mock_drawtext):
+        """Test that video encoding uses the fast encoder settings."""
+        # Mock file existence
+        mock_exists.return_value = True
+
+        # Mock audio duration probe
+        mock_duration.return_value = 10.0
+
+        audio_path = os.path.join(self.temp_dir, "test_audio.wav")
+        video_path = os.path.join(self.temp_dir, "test_video.mp4")
+
+        make_video(audio_path, self.script_data, video_path)
+
+        command = mock_run_ffmpeg.call_args.args[0]
+        self.assertIn('libx264', command)
+        self.assertIn('ultrafast', command)
+        self.assertIn('stillimage', command)
+
+    @patch('tts_video._test_encode', return_value=False)
+    @patch('tts_video.subprocess.run')
+    def test_probe_encoder_rejects_unusable_hardware(self, mock_run, mock_test):
+        """Test that a compiled-in but broken encoder is not selected."""
+        # h264_nvenc is listed in the build but the test encode fails,
+        # as on GPU-less hosts with a distro ffmpeg
+        mock_run.return_value = MagicMock(returncode=0, stdout=b'V..... h264_nvenc  NVIDIA NVENC')
+
+        _probe_encoder.cache_clear()
+        try:
+            self.assertEqual(_probe_encoder(), 'libx264')
+            mock_test.assert_called_once_with('h264_nvenc')
+        finally:
+            _probe_encoder.cache_clear()
+
+    @patch('tts_video._audio_duration', return_value=10.0)
+    @patch('tts_video._mux_audio_video')
+    @patch('tts_video._prerender_slides_no_audio')
+    @patch('tts_video.synthesize_audio_parallel')
     @patch('tts_video.calculate_optimal_duration')
-    def test_generate_pitch_video(self, mock_duration, mock_audio, mock_video):
+    def test_generate_pitch_video(self, mock_duration, mock_audio, mock_prerender, mock_mux, mock_audio_duration):
         """Test complete pitch video generation."""
         # Mock optimal duration calculation
         mock_duration.return_value = 10.0
-        
-        # Mock audio synthesis
+
+        # Mock audio synthesis and rendering stages
         mock_audio.return_value = None
-        
-        # Mock video creation
-        mock_video.return_value = None
-        
+        mock_prerender.return_value = None
+        mock_mux.return_value = None
+
         # Test video generation
         result_path = generate_pitch_video(
-            self.script_data, 
-            self.temp_dir, 
-            "en", 
+            self.script_data,
+            self.temp_dir,
+            "en",
             10.0
         )
-        
+
         # Verify result path
         self.assertTrue(result_path.endswith("pitch_video.mp4"))
         self.assertIn(self.temp_dir, result_path)
-        
-        # Verify functions were called
+
+        # Verify pipeline stages were called
         mock_duration.assert_called_once()
         mock_audio.assert_called_once()
-        mock_video.assert_called_once()
+        mock_prerender.assert_called_once()
+        mock_mux.assert_called_once()
+
+    @patch('tts_video._audio_duration', return_value=12.0)
+    @patch('tts_video._mux_audio_video')
+    @patch('tts_video._prerender_slides_no_audio')
+    @patch('tts_video.synthesize_audio_parallel')
+    @patch('tts_video.calculate_optimal_duration')
+    def test_generate_pitch_video_extends_short_slides(self, mock_duration, mock_audio, mock_prerender, mock_mux, mock_audio_duration):
+        """Test that audio longer than the slides pads the video."""
+        # Slides rendered to a 10s estimate, actual speech runs 12s
+        mock_duration.return_value = 10.0
+
+        generate_pitch_video(self.script_data, self.temp_dir, "en", 10.0)
+
+        # The mux pads by the overrun plus the trim margin
+        extend_by = mock_mux.call_args.kwargs['extend_by']
+        self.assertAlmostEqual(extend_by, 2.25)
+
+    @patch('tts_video._mux_audio_video')
+    @patch('tts_video._prerender_slides_no_audio')
+    @patch('tts_video.synthesize_audio_parallel')
+    def test_generate_pitch_video_cache_hit(self, mock_audio, mock_prerender, mock_mux):
+        """Test that a cached video skips synthesis and rendering."""
+        # Seed the cache with a pre-rendered video for these inputs
+        cache_path = _video_cache_path(self.script_data, "en", 10.0)
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(cache_path, 'wb') as f:
+            f.write(b'cached video data')
+
+        result_path = generate_pitch_video(
+            self.script_data,
+            self.temp_dir,
+            "en",
+            10.0
+        )
+
+        # Cached bytes are served without running the pipeline
+        mock_audio.assert_not_called()
+        mock_prerender.assert_not_called()
+        mock_mux.assert_not_called()
+        with open(result_path, 'rb') as f:
+            self.assertEqual(f.read(), b'cached video data')
 
 
 class TestErrorHandling(unittest.TestCase):
@@ -341,11 +477,27 @@ class TestErrorHandling(unittest.TestCase):
             make_video("nonexistent_audio.wav", script_data, "output.mp4")
         
         self.assertIn("Audio file not found", str(context.exception))
-    
-    @patch('tts_video.synthesize_audio')
-    def test_generate_pitch_video_audio_error(self, mock_audio):
+
+    @patch('tts_video._drawtext_supported', return_value=False)
+    @patch('tts_video._run_ffmpeg')
+    @patch('tts_video._audio_duration', return_value=10.0)
+    @patch('os.path.exists', return_value=True)
+    def test_make_video_without_drawtext(self, mock_exists, mock_duration, mock_run_ffmpeg, mock_drawtext):
+        """Test that a build without drawtext fails fast with guidance."""
+        script_data = {"intro": {"text": "Hello", "duration": 5}}
+
+        with self.assertRaises(Exception) as context:
+            make_video("audio.wav", script_data, "output.mp4")
+
+        self.assertIn("drawtext", str(context.exception))
+        mock_run_ffmpeg.assert_not_called()
+
+    @patch('tts_video._prerender_slides_no_audio')
+    @patch('tts_video.synthesize_audio_parallel')
+    def test_generate_pitch_video_audio_error(self, mock_audio, mock_prerender):
         """Test pitch video generation with audio synthesis error."""
         mock_audio.side_effect = Exception("Audio synthesis failed")
+        mock_prerender.return_value = None
         
         script_data = {'intro': {'text': 'Test'}}
         